@@ -45,7 +45,9 @@ results are accessible via the :attr:`AssignLeaflets.leaflets` attribute.
 Area data are returned in a :class:`numpy.ndarray`, where each row corresponds
 to an individual lipid and each column corresponds to an individual frame, i.e.
 areas[i, j] refers to the area of lipid *i* at frame *j*. The results are
-accessible via the :attr:`AreaPerLipid.areas` attribute.
+accessible via the :attr:`AreaPerLipid.areas` attribute. Areas are stored in
+single precision (`numpy.float32`), which halves the memory required for long
+trajectories.
 
 Note
 ----
@@ -96,6 +98,9 @@ frame) and choose to display a progress bar (`verbose=True`)::
     verbose=True
   )
   
+Frames are independent of one another, so they can be split across multiple
+processes using `n_jobs`, e.g. `areas.run(n_jobs=4)`.
+
 Warning
 -------
     
@@ -118,7 +123,9 @@ The class and its methods
 
 """
 import numpy as np
+import freud.box
 import freud.locality
+from MDAnalysis.lib.distances import apply_PBC
 
 from lipyphilic.lib import base
 
@@ -127,6 +134,8 @@ class AreaPerLipid(base.AnalysisBase):
     """Calculate the area of lipids in each leaflet of a bilayer.
     """
 
+    _frame_results = ("areas",)
+
     def __init__(self, universe,
                  lipid_sel,
                  leaflets
@@ -175,16 +184,46 @@ class AreaPerLipid(base.AnalysisBase):
         
         self.leaflets = np.array(leaflets)
         
-        # lipid species in the membrane
-        self._lipid_species = np.unique(self.membrane.resnames)
-        # number of each lipid species in the membrane
-        num_lipids = {lipid: sum(self.membrane.residues.resnames == lipid) for lipid in self._lipid_species}
+        # The membrane composition does not change, so we need only find once
+        # the species of each atom and residue. Species are identified by their
+        # index in `self._lipid_species`, which is cheaper to compare than resnames.
+        self._lipid_species, atom_species_id, num_atoms = np.unique(
+            self.membrane.resnames, return_inverse=True, return_counts=True
+        )
+        _, res_species_id, num_lipids = np.unique(
+            self.membrane.residues.resnames, return_inverse=True, return_counts=True
+        )
+        self._atom_species_id = atom_species_id.astype(np.int32)
+        self._res_species_id = res_species_id.astype(np.int32)
+
         # number of atoms (seeds) used in the Voronoi tessellation per molecule for each species
-        self._num_seeds = {
-            lipid: sum(self.membrane.resnames == lipid) // num_lipids[lipid] for lipid in self._lipid_species
-        }
+        self._num_seeds = (num_atoms // num_lipids).tolist()
         
+        # Row of `self.membrane.residues` to which each atom in the membrane belongs
+        self._atom_resrow = np.searchsorted(self.membrane.residues.resindices, self.membrane.resindices)
+
+        # freud objects can be reused for repeated calculations
+        self._voro = freud.locality.Voronoi()
+
         self.areas = None
+
+    def __getstate__(self):
+
+        # freud objects cannot be pickled, so the Voronoi instance
+        # is recreated when the analysis is unpickled
+        state = self.__dict__.copy()
+        del state["_voro"]
+
+        # Working arrays are recreated in `_prepare`
+        state.pop("_pos2d", None)
+        state.pop("_static_leaflets", None)
+
+        return state
+
+    def __setstate__(self, state):
+
+        self.__dict__.update(state)
+        self._voro = freud.locality.Voronoi()
           
     def _prepare(self):
         
@@ -195,40 +234,84 @@ class AreaPerLipid(base.AnalysisBase):
         
         # Output array
         self.areas = np.full(
-            (self.membrane.n_residues, self.n_frames),
+            (self.membrane.n_residues, self._n_result_frames),
             fill_value=np.NaN,
-            dtype=float
+            dtype=np.float32,  # single precision is more than sufficient for areas from a Voronoi tessellation
+            order="F"  # each frame is a contiguous column
         )
         
+        # freud.order.Voronoi requires z positions set to 0
+        # Only the xy positions are updated at each frame
+        self._pos2d = np.zeros((self.membrane.n_atoms, 3), dtype=np.float32)
+
+        # If lipids do not change leaflet, we need only find once which are in each leaflet
+        self._static_leaflets = self._get_leaflet_indices(self.leaflets) if self.leaflets.ndim == 1 else None
+
     def _single_frame(self):
         
+        if self.leaflets.ndim == 2:
+            leaflets = self._get_leaflet_indices(self.leaflets[:, self._frame_index])
+        else:
+            leaflets = self._static_leaflets
+
         # Atoms must be wrapped before creating a lateral grid of the membrane
-        self.membrane.wrap(inplace=True)
-        frame_leaflets = self.leaflets[:, self._frame_index] if self.leaflets.ndim == 2 else self.leaflets
-        
+        # The wrapped positions are not written back to the Universe
+        self._pos2d[:, :2] = apply_PBC(self.membrane.positions, self._ts.dimensions)[:, :2]
+
+        # The box may change between frames but is the same for both leaflets
+        box = freud.box.Box(Lx=self._ts.dimensions[0], Ly=self._ts.dimensions[1], is2D=True)
+
         # Calculate area per lipid for the lower (-1) and upper (1) leaflets
         # Areas cannot be calculated for midplane (0) molecules.
-        for leaflet_sign in [-1, 1]:
+        # Each leaflet is tessellated in its own periodic box: placing several
+        # leaflets or frames side by side in one larger box would give wrong areas
+        # to cells at the edge of each, as they would lose their periodic neighbours.
+        for leaflet_resrows, leaflet_atoms in leaflets:
             
-            # freud.order.Voronoi requires z positions set to 0
-            leaflet = self.membrane.residues[frame_leaflets == leaflet_sign].atoms
-            atoms = leaflet.atoms.intersection(self.membrane)
-            pos = atoms.positions
-            pos[:, 2] = 0
+            pos = self._pos2d[leaflet_atoms]
             
             # Check whether any atoms are overlapping in the xy-plane
             self._remove_overlapping(positions=pos)
 
             # Voronoi tessellation to get area per atom
-            areas = self._get_atom_areas(positions=pos)
+            areas = self._get_atom_areas(box=box, positions=pos)
 
             # Calculae area per lipid in the current leaflet
             # by considering the contribution of each
             # atom of a given lipid
             self._get_area_per_lipid(
-                atoms=atoms,
+                leaflet_resrows=leaflet_resrows,
+                leaflet_atoms=leaflet_atoms,
                 atom_areas=areas
             )
+
+    def _get_leaflet_indices(self, frame_leaflets):
+        """Find the residues and atoms of the membrane in each leaflet.
+
+        Parameters
+        ----------
+        frame_leaflets : numpy ndarray
+            Array of shape (n_residues,) containing the leaflet membership of
+            each residue in the membrane.
+
+        Returns
+        -------
+        leaflets : list
+            For the lower (-1) and upper (1) leaflets, a tuple containing the
+            rows of `self.membrane.residues` in the leaflet and the indices of
+            `self.membrane` atoms in the leaflet.
+
+        """
+
+        # Leaflet membership of each atom in the membrane
+        atom_leaflets = frame_leaflets[self._atom_resrow]
+
+        leaflets = [
+            (np.flatnonzero(frame_leaflets == leaflet_sign), np.flatnonzero(atom_leaflets == leaflet_sign))
+            for leaflet_sign in [-1, 1]
+        ]
+
+        return leaflets
             
     def _remove_overlapping(self, positions):
         """Ensure no two atoms are overlapping in the xy plane.
@@ -254,19 +337,29 @@ class AreaPerLipid(base.AnalysisBase):
         # Check whether any atoms are overlapping in the xy-plane
         # This may be an issue in CG sims with cholesteorl flip-flop
         # but is unlikely to be so in all-atom sims
-        _, indices, counts = np.unique(
-            positions, return_index=True, return_counts=True, axis=0
-        )
+        # The single precision xy coordinates of each atom are packed into one
+        # 64-bit key, so sorting the keys places overlapping atoms next to one
+        # another. Freud uses single precision, so atoms that overlap at this
+        # precision must be separated. Adding 0.0 turns -0.0 into 0.0.
+        xy = np.ascontiguousarray(positions[:, :2], dtype=np.float32) + np.float32(0.0)
+        keys = xy.view(np.uint64).ravel()
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        overlapping = np.zeros(len(positions), dtype=bool)
+        overlapping[1:] = sorted_keys[1:] == sorted_keys[:-1]
         
-        # If so, add a small distance between the two atoms (1e-3 A)
-        # in the x dimension
-        if max(counts > 1):
-            for duplicate_index in indices[counts > 1]:
-                positions[duplicate_index, 0] += 0.001
+        # If so, add a small distance between the atoms (1e-3 A)
+        # in the x dimension. If more than two atoms share the same
+        # position, each is moved by a different amount, in order of index.
+        if overlapping.any():
+            sorted_indices = np.arange(len(positions))
+            first_index = np.maximum.accumulate(np.where(overlapping, 0, sorted_indices))
+            shift = (sorted_indices - first_index)[overlapping]
+            positions[order[overlapping], 0] += 0.001 * shift
                 
         return None
 
-    def _get_atom_areas(self, positions):
+    def _get_atom_areas(self, box, positions):
         """Calculate area per atom.
         
         Given xy coordinates of atomic positions, perform a Voronoi
@@ -274,6 +367,8 @@ class AreaPerLipid(base.AnalysisBase):
         
         Parameters
         ----------
+        box : freud.box.Box
+            Two-dimensional periodic box of the current frame.
         positions : numpy ndarray
             Array of shape (n_atoms, 3) containing atomic coordinates.
         
@@ -284,29 +379,23 @@ class AreaPerLipid(base.AnalysisBase):
         
         """
         
-        voro = freud.locality.Voronoi()
-        areas = voro.compute(
-            system=(
-                {
-                    "Lx": self._ts.dimensions[0],
-                    "Ly": self._ts.dimensions[1],
-                    "dimensions": 2
-                },
-                positions
-            )
-        ).volumes
+        areas = self._voro.compute(system=(box, positions)).volumes
         
         return areas
     
-    def _get_area_per_lipid(self, atoms, atom_areas):
+    def _get_area_per_lipid(self, leaflet_resrows, leaflet_atoms, atom_areas):
         """Calclate the area per lipid given the areas of every Voronoi cell in a tessellation.
         
         This involves summing contributions from each atom of a given lipid.
         
         Parameters
         ----------
-        atoms : MDAnalysis AtomGroup
-            AtomGroup for which a 2D Voronoi tessellation was performed
+        leaflet_resrows : numpy ndarray
+            Rows of `self.membrane.residues` in the leaflet for which a 2D Voronoi
+            tessellation was performed
+        leaflet_atoms : numpy ndarray
+            Indices of the atoms in `self.membrane` that were used in the 2D
+            Voronoi tessellation
         atom_areas : numpy ndarray
             Array of areas of each atom in the 2D Voronoi tessellation
         
@@ -316,25 +405,22 @@ class AreaPerLipid(base.AnalysisBase):
             The lipid areas are modified in place.
         """
         
-        for species in self._lipid_species:
+        # Species of each atom and residue in the leaflet
+        atom_species_id = self._atom_species_id[leaflet_atoms]
+        res_species_id = self._res_species_id[leaflet_resrows]
 
-            species_indices = atoms.resnames == species
+        for species_id, num_seeds in enumerate(self._num_seeds):
             
             # We need to sum the area contribution of each cell for a given lipid
-            species_apl = atom_areas[species_indices]
-            species_atoms = atoms[species_indices]
-            species_apl = np.sum(
-                species_apl.reshape(species_atoms.n_residues, self._num_seeds[species]),
-                axis=1
-            )
+            # The cells of each lipid are consecutive, so the nth cell of every
+            # lipid is a strided slice. Single-seed species, such as sterols,
+            # need no summation at all.
+            species_cell_areas = atom_areas[atom_species_id == species_id]
+            species_apl = species_cell_areas[::num_seeds]
+            for seed in range(1, num_seeds):
+                species_apl = species_apl + species_cell_areas[seed::num_seeds]
 
             # store apl for current lipid species
-            species_resindices = np.in1d(
-                self.membrane.residues.resindices,
-                species_atoms.residues.resindices,
-                assume_unique=True
-            )
-            
-            self.areas[species_resindices, self._frame_index] = species_apl
+            self.areas[leaflet_resrows[res_species_id == species_id], self._result_index] = species_apl
             
         return None
@@ -71,6 +71,9 @@ frame) and choose to display a progress bar (`verbose=True`)::
     verbose=True
   )
   
+Frames are independent of one another, so they can be split across multiple
+processes using `n_jobs`, e.g. `leaflets.run(n_jobs=4)`.
+
 The results are then available in the :attr:`leaflets.leaflets` attribute as a
 :class:`numpy.ndarray`. Each row corresponds to an individual lipid and each column
 to an individual frame, i.e `leaflets.leaflets[i, j]` contains the leaflet
@@ -123,7 +126,7 @@ The class and its methods
 """
 
 import numpy as np
-import scipy.stats
+from MDAnalysis.lib.distances import apply_PBC
 
 from lipyphilic.lib import base
 
@@ -132,6 +135,8 @@ class AssignLeaflets(base.AnalysisBase):
     """Assign lipids in a bilayer to the upper leaflet, lower leaflet, or midplane.
     """
 
+    _frame_results = ("leaflets",)
+
     def __init__(self, universe,
                  lipid_sel,
                  midplane_sel=None, midplane_cutoff=None,
@@ -195,6 +200,24 @@ class AssignLeaflets(base.AnalysisBase):
                              "in lipid_sel. lipid_sel must cover *all* residues in the membrane."
                              )
 
+        # The membrane composition does not change, so we can find once the row
+        # of `self.leaflets` to which each membrane atom and midplane residue belongs
+        self._atom_resrow = np.searchsorted(self.membrane.residues.resindices, self.membrane.resindices)
+        if self.potential_midplane is not None:
+            self._midplane_resrow = np.searchsorted(
+                self.membrane.residues.resindices, self.potential_midplane.residues.resindices
+            )
+            # Row of `self.potential_midplane.residues` to which each midplane atom belongs
+            self._midplane_atom_resrow = np.searchsorted(
+                self.potential_midplane.residues.resindices, self.potential_midplane.resindices
+            )
+
+        # All atoms of the membrane residues, which are used to find the membrane midpoint
+        self._residue_atoms = self.membrane.residues.atoms
+        # Which atoms of the membrane residues are in the membrane selection
+        # `ResidueGroup.atoms` is ordered by residue, not by atom index
+        self._residue_atom_in_memb = np.isin(self._residue_atoms.indices, self.membrane.indices)
+
         self.n_bins = n_bins
         self.leaflets = None
         
@@ -202,130 +225,188 @@ class AssignLeaflets(base.AnalysisBase):
         
         # Output array
         self.leaflets = np.full(
-            (self.membrane.n_residues, self.n_frames),
+            (self.membrane.n_residues, self._n_result_frames),
             fill_value=0,
-            dtype=np.int8  # smallest sized `np.int` is 1 byte, still 8 times smaller than using `int`
+            dtype=np.int8,  # smallest sized `np.int` is 1 byte, still 8 times smaller than using `int`
+            order="F"  # each frame is a contiguous column
         )
 
     def _single_frame(self):
         
         # Atoms must be wrapped before creating a lateral grid of the membrane
-        self.membrane.wrap(inplace=True)
+        # The wrapped positions are not written back to the Universe
+        memb_pos = apply_PBC(self.membrane.positions, self._ts.dimensions)
+
+        # If every atom of the membrane residues is in the membrane selection,
+        # the two AtomGroups are identical
+        if self._residue_atoms.n_atoms == self.membrane.n_atoms:
+            residue_pos = memb_pos
+        else:
+            # Only atoms in the membrane selection are wrapped
+            residue_pos = self._residue_atoms.positions
+            residue_pos[self._residue_atom_in_memb] = apply_PBC(
+                residue_pos[self._residue_atom_in_memb], self._ts.dimensions
+            )
 
         # Find the midpoint of the bilayer as a function of (x,y), using
         # `n_bins` grid points in each dimensions
         # Use all atoms in the membrane to get better statistics
-        if self.n_bins > 1:
-            bins = np.linspace(0.0, self._ts.dimensions[0], self.n_bins + 1)
-        else:
-            # scipy.stats.binned_statistics raises Value error if there is only one bin
-            bins = [0.0, self._ts.dimensions[0] + 1, self._ts.dimensions[0] + 2]
-        
-        memb_midpoint_xy = scipy.stats.binned_statistic_2d(
-            x=self.membrane.residues.atoms.positions[:, 0],
-            y=self.membrane.residues.atoms.positions[:, 1],
-            values=self.membrane.residues.atoms.positions[:, 2],
-            statistic="mean",
-            bins=bins,
-            expand_binnumbers=True
+        memb_midpoint_xy = _midpoints(
+            positions=residue_pos,
+            box=self._ts.dimensions[:2],
+            n_bins=self.n_bins
         )
         
         # Assign leaflets
-        self._assign_leaflets(memb_midpoint_xy)
+        self._assign_leaflets(positions=memb_pos, midpoints=memb_midpoint_xy)
         
         # if necessary, find midplane residues
         if (self.potential_midplane is not None) and self.midplane_cutoff > 0.0:
-            self._find_midplane(memb_midpoint_xy=memb_midpoint_xy)
+            self._find_midplane(midpoints=memb_midpoint_xy)
     
-    def _assign_leaflets(self, memb_midpoint_xy):
+    def _assign_leaflets(self, positions, midpoints):
         """Assign lipids to the upper (1) or lower (-1) leaflet.
 
         Parameters
         ----------
-        memb_midpoint_xy : BinnedStatistic2dResult
-            Membrane grid created with stats.binned_statistic_2d. Contains the midpoint of
-            each membrane patch.
+        positions : numpy.ndarray
+            Array of shape (n_atoms, 3) containing the wrapped coordinates
+            of the membrane atoms.
+        midpoints : numpy.ndarray
+            Array of shape (n_bins, n_bins) containing the midpoint of each
+            membrane patch.
         """
         
-        # x and y have the same number of bins
-        bins = memb_midpoint_xy.x_edge
-        
-        # get the binnumbers for each lipid
-        lipid_x_bins, lipid_y_bins = scipy.stats.binned_statistic_2d(
-            x=self.membrane.positions[:, 0],
-            y=self.membrane.positions[:, 1],
-            values=self.membrane.positions[:, 2],
-            statistic="mean",
-            bins=bins,
-            expand_binnumbers=True
-        ).binnumber -1  # These were bin numbers, now bin indices  # noqa: E225
-        
-        upper_leaflet = self.membrane[
-            self.membrane.positions[:, 2] >
-            (memb_midpoint_xy.statistic[lipid_x_bins, lipid_y_bins])  # we don't to consider midplane_cutoff here
-        ]
-        self.leaflets[
-            np.in1d(self.membrane.residues.resindices, upper_leaflet.residues.resindices),
-            self._frame_index
-        ] = 1
+        # we don't to consider midplane_cutoff here
+        atom_leaflets = _classify(
+            positions=positions,
+            box=self._ts.dimensions[:2],
+            n_bins=self.n_bins,
+            midpoints=midpoints,
+            cutoff=0.0
+        )
         
-        lower_leaflet = self.membrane[
-            self.membrane.positions[:, 2] <
-            (memb_midpoint_xy.statistic[lipid_x_bins, lipid_y_bins])  # we don't to consider midplane_cutoff here
-        ]
-        self.leaflets[
-            np.in1d(self.membrane.residues.resindices, lower_leaflet.residues.resindices),
-            self._frame_index
-        ] = -1
+        # Number of atoms of each residue above and below their local midpoint
+        n_upper = np.bincount(self._atom_resrow, weights=atom_leaflets == 1, minlength=self.membrane.n_residues)
+        n_lower = np.bincount(self._atom_resrow, weights=atom_leaflets == -1, minlength=self.membrane.n_residues)
+
+        # A residue with any atom below its local midpoint is in the lower leaflet
+        self.leaflets[:, self._result_index] = np.where(n_lower > 0, -1, np.where(n_upper > 0, 1, 0))
         
         return None
          
-    def _find_midplane(self, memb_midpoint_xy):
+    def _find_midplane(self, midpoints):
         """Determine which residues are in the midplane
 
         Parameters
         ----------
-        memb_midpoint_xy : BinnedStatistic2dResult
-            Membrane grid created with stats.binned_statistic_2d. Contains the midpoint of
-            each membrane patch.
+        midpoints : numpy.ndarray
+            Array of shape (n_bins, n_bins) containing the midpoint of each
+            membrane patch.
         """
         
         # Atoms must be wrapped before so we can assign lipids to grid patches
-        self.potential_midplane.wrap(inplace=True)
-        
-        # x and y have the same number of bins
-        bins = memb_midpoint_xy.x_edge
-        
-        midplane_x_bins, midplane_y_bins = scipy.stats.binned_statistic_2d(
-            x=self.potential_midplane.positions[:, 0],
-            y=self.potential_midplane.positions[:, 1],
-            values=self.potential_midplane.positions[:, 2],
-            statistic="mean",
-            bins=bins,
-            expand_binnumbers=True
-        ).binnumber -1  # These were bin numbers, now bin indices  # noqa: E225
+        midplane_pos = apply_PBC(self.potential_midplane.positions, self._ts.dimensions)
         
-        # First assume they're all midplane
-        # Then find residues that have at least one atom further than
-        # `midplane_cutoff` from the local midplane
-        midplane_mask = np.full(self.potential_midplane.n_residues, fill_value=True, dtype=bool)
-
-        not_midplane = np.abs(
-            self.potential_midplane.positions[:, 2] - memb_midpoint_xy.statistic[midplane_x_bins, midplane_y_bins]
-        ) > self.midplane_cutoff
-
-        # These residues have at least one atom in `potential_midplane`
-        # that is more the `midplane_cutoff` from the local midplane
-        midplane_mask[
-            np.in1d(self.potential_midplane.residues.resindices, self.potential_midplane[not_midplane].resindices),
-        ] = False
-
-        midplane_residues = self.potential_midplane.residues[midplane_mask]
-
-        # Assign midplane
-        self.leaflets[
-            np.in1d(self.membrane.residues.resindices, midplane_residues.resindices),
-            self._frame_index
-        ] = 0
+        not_midplane = _classify(
+            positions=midplane_pos,
+            box=self._ts.dimensions[:2],
+            n_bins=self.n_bins,
+            midpoints=midpoints,
+            cutoff=self.midplane_cutoff
+        ) != 0
+
+        # Number of atoms of each residue in `potential_midplane` that are
+        # more than `midplane_cutoff` from the local midplane
+        n_not_midplane = np.bincount(
+            self._midplane_atom_resrow,
+            weights=not_midplane,
+            minlength=self.potential_midplane.n_residues
+        )
+
+        # Residues with every atom within `midplane_cutoff` are in the midplane
+        self.leaflets[self._midplane_resrow[n_not_midplane == 0], self._result_index] = 0
         
         return None
+
+
+def _midpoints(positions, box, n_bins):
+    """Find the midpoint in *z* of each patch of a membrane.
+
+    The membrane is split into *n_bins \\* n_bins* patches in *xy*, and the
+    midpoint of each patch is the mean *z* position of the atoms in it.
+
+    Parameters
+    ----------
+    positions : numpy.ndarray
+        Array of shape (n_atoms, 3) containing atomic coordinates. Atoms
+        outside the box in *x* or *y* are ignored.
+    box : numpy.ndarray
+        Array containing the *x* and *y* dimensions of the box.
+    n_bins : int
+        Number of bins in *x* and *y* used to create the grid of membrane patches.
+
+    Returns
+    -------
+    midpoints : numpy.ndarray
+        Array of shape (n_bins, n_bins) containing the midpoint of each
+        membrane patch. Empty patches have a midpoint of NaN.
+    """
+
+    # The patch of each atom can be found directly from its scaled position,
+    # so there is no need to create the bin edges of the grid
+    scaled = positions[:, :2] * (n_bins / box)
+    in_box = np.all((scaled >= 0) & (scaled <= n_bins), axis=1)
+    patches = np.minimum(scaled[in_box].astype(np.intp), n_bins - 1)
+    patches = patches[:, 0] * n_bins + patches[:, 1]
+
+    # The mean z position of atoms in each patch is the sum of their
+    # z positions divided by the number of atoms in the patch
+    sum_z = np.bincount(patches, weights=positions[in_box, 2], minlength=n_bins * n_bins)
+    counts = np.bincount(patches, minlength=n_bins * n_bins)
+
+    with np.errstate(invalid="ignore"):
+        midpoints = sum_z / counts
+
+    return midpoints.reshape(n_bins, n_bins)
+
+
+def _classify(positions, box, n_bins, midpoints, cutoff):
+    """Classify atoms by their distance in *z* to their local membrane midpoint.
+
+    Each atom is placed in a membrane patch based on its *xy* position, then
+    compared with the midpoint of that patch.
+
+    Parameters
+    ----------
+    positions : numpy.ndarray
+        Array of shape (n_atoms, 3) containing wrapped atomic coordinates.
+    box : numpy.ndarray
+        Array containing the *x* and *y* dimensions of the box.
+    n_bins : int
+        Number of bins in *x* and *y* used to create the grid of membrane patches.
+    midpoints : numpy.ndarray
+        Array of shape (n_bins, n_bins) containing the midpoint of each
+        membrane patch.
+    cutoff : float
+        Atoms within this distance in *z* of their local midpoint are
+        classified as `0`.
+
+    Returns
+    -------
+    classification : numpy.ndarray
+        Array of shape (n_atoms,) in which atoms more than `cutoff` above their
+        local midpoint are `1`, those more than `cutoff` below are `-1`, and
+        all others are `0`.
+    """
+
+    # Patch indices of each atom, which are in the range [0, n_bins)
+    # as the positions are wrapped
+    patches = np.clip((positions[:, :2] * (n_bins / box)).astype(np.intp), 0, n_bins - 1)
+    local_midpoints = midpoints[patches[:, 0], patches[:, 1]]
+
+    classification = np.zeros(len(positions), dtype=np.int8)
+    classification[positions[:, 2] > local_midpoints + cutoff] = 1
+    classification[positions[:, 2] < local_midpoints - cutoff] = -1
+
+    return classification
@@ -31,7 +31,10 @@ classes.
 import inspect
 import itertools
 import logging
+import multiprocessing
+import pickle
 
+import MDAnalysis
 import numpy as np
 from MDAnalysis import coordinates
 from MDAnalysis.core.groups import AtomGroup
@@ -86,6 +89,14 @@ class AnalysisBase(object):
        na = NewAnalysis(u.select_atoms('name CA'), 35).run(start=10, stop=20)
        print(na.result)
 
+    Frames may be analysed in parallel by passing ``n_jobs`` to
+    :meth:`run`. This requires `_single_frame` to store its results in arrays
+    with one column per frame, whose names are listed in `_frame_results`.
+    These arrays must be created in `_prepare` with `_n_result_frames` columns,
+    and `_single_frame` must write to column `_result_index`. `_frame_index`
+    remains the index of the frame among all analysed frames, and should be
+    used to read any per-frame input.
+
     Attributes
     ----------
     times: np.ndarray
@@ -95,6 +106,14 @@ class AnalysisBase(object):
 
     """
 
+    # Names of the attributes, created in `_prepare`, in which `_single_frame`
+    # stores its results. Each must be an array with one column per frame.
+    _frame_results = ()
+
+    # Maximum number of consecutive frames sent to a process at once when
+    # running in parallel
+    _parallel_block_size = 10
+
     def __init__(self, trajectory, verbose=False, **kwargs):
         """
         Parameters
@@ -161,7 +180,7 @@ class AnalysisBase(object):
         """
         pass  # pylint: disable=unnecessary-pass
 
-    def run(self, start=None, stop=None, step=None, verbose=None):
+    def run(self, start=None, stop=None, step=None, verbose=None, n_jobs=1):
         """Perform the calculation
 
         Parameters
@@ -174,28 +193,158 @@ class AnalysisBase(object):
             number of frames to skip between each analysed frame
         verbose : bool, optional
             Turn on verbosity
+        n_jobs : int, optional
+            Number of processes over which to split the frames. Each process
+            analyses a contiguous block of frames. The default is `1`, in which
+            case the frames are analysed serially. Values greater than `1`
+            require MDAnalysis>=2.0, in which Universes can be pickled, and
+            raise a ValueError with earlier versions.
         """
         logger.info("Choosing frames to analyze")
         # if verbose unchanged, use class default
         verbose = getattr(self, '_verbose',
                           False) if verbose is None else verbose
 
+        if not isinstance(n_jobs, (int, np.integer)):
+            raise ValueError(f"'n_jobs' must be an integer, but {n_jobs} was given")
+
+        if n_jobs < 1:
+            raise ValueError("'n_jobs' must be greater than or equal to 1")
+
+        # Universes can be pickled only from MDAnalysis 2.0
+        if n_jobs > 1 and int(MDAnalysis.__version__.split(".")[0]) < 2:
+            raise ValueError(f"'n_jobs' greater than 1 requires MDAnalysis>=2.0, but "
+                             f"MDAnalysis {MDAnalysis.__version__} is installed"
+                             )
+
+        if n_jobs > 1 and not self._frame_results:
+            raise NotImplementedError(f"{type(self).__name__} cannot be run in parallel")
+
         self._setup_frames(self._trajectory, start, stop, step)
+
+        # With no frames to analyse there is nothing to split between processes
+        if self.n_frames == 0:
+            n_jobs = 1
+
+        # Workers each receive a copy of the analysis without any output arrays,
+        # including those from a previous run. Unpickling the Universe reopens
+        # its trajectory, so workers do not share a file handle.
+        if n_jobs > 1:
+            for name in self._frame_results:
+                setattr(self, name, None)
+            analysis = pickle.dumps(self)
+        else:
+            analysis = None
+
         logger.info("Starting preparation")
+        self._n_result_frames = self.n_frames
         self._prepare()
-        for i, ts in enumerate(ProgressBar(
-                self._trajectory[self.start:self.stop:self.step],
-                verbose=verbose)):
-            self._frame_index = i
-            self._ts = ts
-            self.frames[i] = ts.frame
-            self.times[i] = ts.time
-            # logger.info("--> Doing frame {} of {}".format(i+1, self.n_frames))
-            self._single_frame()
+
+        if n_jobs == 1:
+            for i, ts in enumerate(ProgressBar(
+                    self._trajectory[self.start:self.stop:self.step],
+                    verbose=verbose)):
+                self._frame_index = i
+                self._result_index = i
+                self._ts = ts
+                self.frames[i] = ts.frame
+                self.times[i] = ts.time
+                # logger.info("--> Doing frame {} of {}".format(i+1, self.n_frames))
+                self._single_frame()
+        else:
+            self._run_parallel(analysis, n_jobs, verbose)
+
         logger.info("Finishing up")
         self._conclude()
         return self
 
+    def _run_parallel(self, analysis, n_jobs, verbose):
+        """Analyse blocks of frames in separate processes
+
+        Frames are sent to the processes in small blocks of consecutive frames,
+        so that each process holds the results of only a few frames at a time.
+
+        Parameters
+        ----------
+        analysis : bytes
+            The pickled analysis, as it was before calling `_prepare`.
+        n_jobs : int
+            Number of processes over which to split the frames.
+        verbose : bool
+            Turn on verbosity
+        """
+        block_size = min(self._parallel_block_size, -(-self.n_frames // n_jobs))
+        blocks = [
+            np.arange(block_start, min(block_start + block_size, self.n_frames))
+            for block_start in range(0, self.n_frames, block_size)
+        ]
+
+        with multiprocessing.Pool(
+                processes=min(n_jobs, len(blocks)),
+                initializer=_init_worker,
+                initargs=(analysis,)) as pool, ProgressBar(
+                total=self.n_frames,
+                verbose=verbose) as progress:
+            for block, frames, times, results in pool.imap_unordered(_run_block, blocks):
+                self.frames[block] = frames
+                self.times[block] = times
+                for name, result in zip(self._frame_results, results):
+                    getattr(self, name)[:, block] = result
+                progress.update(len(block))
+
+
+# The analysis being run by a worker process
+_worker_analysis = None
+
+
+def _init_worker(analysis):
+    """Unpickle the analysis once per worker process"""
+    global _worker_analysis
+    _worker_analysis = pickle.loads(analysis)
+
+
+def _run_block(block):
+    """Analyse a contiguous block of frames in a worker process
+
+    Output arrays are created with one column per frame in the block.
+
+    Parameters
+    ----------
+    block : numpy.ndarray
+        Indices, in the range [0, n_frames), of the frames to analyse.
+
+    Returns
+    -------
+    block : numpy.ndarray
+        The indices of the analysed frames.
+    frames : numpy.ndarray
+        The Timestep frame index of each analysed frame.
+    times : numpy.ndarray
+        The Timestep time of each analysed frame.
+    results : list
+        For each attribute in `_frame_results`, the columns corresponding to
+        the analysed frames.
+    """
+    analysis = _worker_analysis
+    analysis._n_result_frames = len(block)
+    analysis._prepare()
+
+    trajectory_frames = np.arange(analysis.start, analysis.stop, analysis.step)[block]
+    frames = np.zeros(len(block), dtype=int)
+    times = np.zeros(len(block))
+
+    for j, (i, ts) in enumerate(zip(block, analysis._trajectory[trajectory_frames])):
+        analysis._frame_index = i
+        analysis._result_index = j
+        analysis._ts = ts
+        frames[j] = ts.frame
+        times[j] = ts.time
+        analysis._single_frame()
+
+    results = [getattr(analysis, name) for name in analysis._frame_results]
+
+    return block, frames, times, results
+
 
 class AnalysisFromFunction(AnalysisBase):
     """
@@ -2,8 +2,9 @@
 import pytest
 import numpy as np
 import MDAnalysis
+from MDAnalysis.coordinates.memory import MemoryReader
 
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 
 from lipyphilic._simple_systems.simple_systems import (
     HEX_LAT, HEX_LAT_BUMP_MID_MOL, HEX_LAT_OVERLAP)
@@ -41,7 +42,60 @@ class TestAreaPerLipid:
         assert areas.areas.shape == (reference['n_residues'], reference['n_frames'])
         assert_array_almost_equal(areas.areas, 200.0, decimal=8)
         
+    @pytest.mark.skipif(
+        int(MDAnalysis.__version__.split(".")[0]) < 2,
+        reason="running in parallel requires MDAnalysis>=2.0"
+    )
+    def test_parallel(self, universe, areas):
+
+        parallel = AreaPerLipid(universe, **self.kwargs)
+        parallel.run(n_jobs=2)
+
+        assert_array_almost_equal(parallel.areas, areas.areas)
+
         
+class TestAreaPerLipidParallel:
+
+    n_frames = 6
+
+    @pytest.fixture(scope='class')
+    def universe(self):
+
+        # The lattice is translated in x at each frame
+        u = MDAnalysis.Universe(HEX_LAT)
+        coordinates = np.array([u.atoms.positions + [frame, 0, 0] for frame in range(self.n_frames)])
+        u.load_new(coordinates, format=MemoryReader, dimensions=u.dimensions)
+
+        return u
+
+    @pytest.fixture(scope='class')
+    def leaflets(self):
+
+        # At frame i, residue i is in the midplane (0)
+        leaflets = np.array([[1] * self.n_frames] * 50 + [[-1] * self.n_frames] * 50)
+        leaflets[np.arange(self.n_frames), np.arange(self.n_frames)] = 0
+
+        return leaflets
+
+    @pytest.mark.skipif(
+        int(MDAnalysis.__version__.split(".")[0]) < 2,
+        reason="running in parallel requires MDAnalysis>=2.0"
+    )
+    def test_parallel(self, universe, leaflets):
+
+        serial = AreaPerLipid(universe, lipid_sel='name L C', leaflets=leaflets)
+        serial.run()
+
+        parallel = AreaPerLipid(universe, lipid_sel='name L C', leaflets=leaflets)
+        parallel.run(n_jobs=3)
+
+        assert_array_almost_equal(parallel.areas, serial.areas)
+        assert_array_equal(parallel.frames, serial.frames)
+
+        # Only the midplane residue of each frame has no area
+        assert_array_equal(np.isnan(parallel.areas), leaflets == 0)
+
+
 class TestAreaPerLipidOverlapping:
     
     @staticmethod
@@ -67,6 +121,18 @@ class TestAreaPerLipidOverlapping:
         # only the areas of 6 residues should be affected by these two overlapping atoms
         assert np.isclose(areas.areas, 200).sum() == 94
 
+    def test_remove_overlapping(self, areas):
+
+        # three atoms share the same position, and a fourth shares only its x coordinate
+        positions = np.array([[1, 1, 0], [2, 2, 0], [1, 1, 0], [1, 1, 0], [1, 3, 0]], dtype=np.float32)
+        areas._remove_overlapping(positions)
+
+        assert len(np.unique(positions, axis=0)) == 5
+        assert_array_almost_equal(positions[[1, 4]], [[2, 2, 0], [1, 3, 0]])
+
+        # the lowest-index overlapping atom stays put and the others are shifted in index order
+        assert_array_almost_equal(positions[[0, 2, 3], 0], [1.0, 1.001, 1.002], decimal=5)
+
 
 class TestAreaPerLipidMidplaneMol:
     
@@ -6,7 +6,7 @@ import MDAnalysis
 from numpy.testing import assert_array_equal
 
 from lipyphilic._simple_systems.simple_systems import (
-    HEX_LAT, HEX_LAT_BUMP, HEX_LAT_BUMP_MID_MOL, HEX_LAT_BUMP_MID_ATOM)
+    HEX_LAT, HEX_LAT_BUMP, HEX_LAT_BUMP_MID_MOL, HEX_LAT_BUMP_MID_ATOM, ONE_CHOL, ONE_CHOL_TRAJ)
 from lipyphilic.lib.assign_leaflets import AssignLeaflets
  
  
@@ -92,6 +92,73 @@ class TestAssignLeafletsExceptions:
                 midplane_cutoff=10
             )
         
+        match = "'n_jobs' must be greater than or equal to 1"
+        with pytest.raises(ValueError, match=match):
+            AssignLeaflets(
+                universe=universe,
+                lipid_sel="name L C"
+            ).run(n_jobs=0)
+
+        match = "'n_jobs' must be an integer"
+        with pytest.raises(ValueError, match=match):
+            AssignLeaflets(
+                universe=universe,
+                lipid_sel="name L C"
+            ).run(n_jobs=1.5)
+
+    def test_parallel_old_MDAnalysis(self, universe, monkeypatch):
+
+        monkeypatch.setattr(MDAnalysis, "__version__", "1.1.1")
+
+        match = "'n_jobs' greater than 1 requires MDAnalysis>=2.0"
+        with pytest.raises(ValueError, match=match):
+            AssignLeaflets(
+                universe=universe,
+                lipid_sel="name L C"
+            ).run(n_jobs=2)
+
+
+class TestAssignLeafletsParallel:
+
+    @staticmethod
+    @pytest.fixture(scope='class')
+    def universe():
+        return MDAnalysis.Universe(ONE_CHOL, ONE_CHOL_TRAJ)
+
+    kwargs = {
+        'lipid_sel': 'resname CHOL',
+        'midplane_sel': 'name ROH C2',
+        'midplane_cutoff': 5.0
+    }
+
+    @pytest.mark.skipif(
+        int(MDAnalysis.__version__.split(".")[0]) < 2,
+        reason="running in parallel requires MDAnalysis>=2.0"
+    )
+    def test_parallel(self, universe):
+
+        serial = AssignLeaflets(universe, **self.kwargs)
+        serial.run(step=2)
+
+        parallel = AssignLeaflets(universe, **self.kwargs)
+        parallel.run(step=2, n_jobs=3)
+
+        assert_array_equal(parallel.leaflets, serial.leaflets)
+        assert_array_equal(parallel.frames, serial.frames)
+        assert_array_equal(parallel.times, serial.times)
+
+    @pytest.mark.skipif(
+        int(MDAnalysis.__version__.split(".")[0]) < 2,
+        reason="running in parallel requires MDAnalysis>=2.0"
+    )
+    def test_parallel_no_frames(self, universe):
+
+        parallel = AssignLeaflets(universe, **self.kwargs)
+        parallel.run(start=5, stop=5, n_jobs=2)
+
+        assert parallel.leaflets.shape == (universe.select_atoms(self.kwargs['lipid_sel']).n_residues, 0)
+        assert parallel.frames.size == 0
+
 
 class TestAssignLeafletsUndulating:
     
@@ -204,3 +271,45 @@ class TestAssignLeafletsUndulatingMidplaneAtom:
         assert_array_equal(np.unique(leaflets.leaflets), reference['leaflets_present'])
         assert_array_equal(universe.residues[leaflets.leaflets[:, 0] == 0].resnames, reference['midplane_resnames'])
         assert_array_equal(universe.residues[leaflets.leaflets[:, 0] == 0].resids, reference['midplane_resids'])
+
+
+class TestAssignLeafletsRectangular:
+
+    @staticmethod
+    @pytest.fixture(scope='class')
+    def universe():
+
+        # 12 x 6 single-atom lipids per leaflet in a 120 x 60 Angstrom box
+        # The bilayer midpoint is at z=20 for y < 30 and at z=40 for y > 30
+        x, y = np.meshgrid(np.arange(5, 120, 10), np.arange(5, 60, 10))
+        x, y = x.ravel(), y.ravel()
+        midpoint = np.where(y < 30, 20, 40)
+
+        n_lipids = 2 * x.size
+        u = MDAnalysis.Universe.empty(
+            n_atoms=n_lipids,
+            n_residues=n_lipids,
+            atom_resindex=np.arange(n_lipids),
+            trajectory=True
+        )
+        u.add_TopologyAttr("names", ["L"] * n_lipids)
+        u.add_TopologyAttr("resnames", ["LIPID"] * n_lipids)
+        u.atoms.positions = np.concatenate([
+            np.stack([x, y, midpoint + 8], axis=1),  # upper leaflet
+            np.stack([x, y, midpoint - 8], axis=1),  # lower leaflet
+        ])
+        u.dimensions = [120, 60, 100, 90, 90, 90]
+
+        return u
+
+    def test_nbins2(self, universe):
+
+        # Patches in y must span half the box length in y, not in x
+        leaflets = AssignLeaflets(universe, lipid_sel="name L", n_bins=2)
+        leaflets.run()
+
+        reference = {
+            'leaflets': np.array([[1]] * 72 + [[-1]] * 72)
+        }
+
+        assert_array_equal(leaflets.leaflets, reference['leaflets'])